@@ -1,19 +1,19 @@
-from scrapy import Item, Field
+from dataclasses import dataclass, field
+from typing import Optional
 
 
-class ProductItem(Item):
-    product_url = Field()
-    product_name = Field()
-    price = Field()
-    sku = Field()
-    size = Field()
-    color = Field()
-    size_list = Field()
-    color_list = Field()
-    description = Field()
-    care_instructions = Field()
-    image_urls = Field()
-    product_details = Field()
-    currency = Field()
-
-    # <-- Newline
+@dataclass(slots=True)
+class ProductItem:
+    product_url: Optional[str] = None
+    product_name: Optional[str] = None
+    price: Optional[float] = None
+    sku: Optional[str] = None
+    size: Optional[str] = None
+    color: Optional[str] = None
+    size_list: list = field(default_factory=list)
+    color_list: list = field(default_factory=list)
+    description: Optional[str] = None
+    care_instructions: Optional[str] = None
+    image_urls: list = field(default_factory=list)
+    product_details: dict = field(default_factory=dict)
+    currency: Optional[str] = None
@@ -1,7 +1,10 @@
+import math
 import time
 import random
 from scrapy.downloadermiddlewares.retry import RetryMiddleware
+from scrapy.utils.httpobj import urlparse_cached
 from scrapy.utils.response import response_status_message
+from twisted.internet.task import deferLater
 
 
 class CustomRetryMiddleware(RetryMiddleware):
@@ -18,6 +21,24 @@ class CustomRetryMiddleware(RetryMiddleware):
                 'RETRY_HTTP_CODES', [
                     429, 503, 504]))
         self.priority_adjust = settings.getint('RETRY_PRIORITY_ADJUST', -1)
+        self.max_slot_delay = settings.getfloat('RETRY_MAX_SLOT_DELAY', 60)
+        # Per download slot: time until which requests are held back, and
+        # the length of the last pause (doubled on each further 429/503)
+        self.slot_paused_until = {}
+        self.slot_pause = {}
+
+    def process_request(self, request, spider):
+        """Hold requests back while their download slot is paused"""
+        # AutoThrottle rewrites the slot delay on every response, so the
+        # pause is enforced here rather than through slot.delay
+        if not self.slot_paused_until:
+            return None
+        slot_key = spider.crawler.engine.downloader.get_slot_key(request)
+        wait = self.slot_paused_until.get(slot_key, 0) - time.time()
+        if wait > 0:
+            from twisted.internet import reactor
+            return deferLater(reactor, wait, lambda: None)
+        return None
 
     def process_response(self, request, response, spider):
         """Process responses and retry if needed"""
@@ -25,6 +46,12 @@ class CustomRetryMiddleware(RetryMiddleware):
         if response.status in self.retry_http_codes:
             reason = response_status_message(response.status)
 
+            # Rate limited or overloaded: pause the whole download slot,
+            # since AutoThrottle does not react to these status codes
+            retry_after = 0
+            if response.status in (429, 503):
+                retry_after = self._throttle_slot(request, response, spider)
+
             # Special handling for 429 (rate limit)
             if response.status == 429:
                 retry_times = request.meta.get('retry_times', 0) + 1
@@ -34,7 +61,8 @@ class CustomRetryMiddleware(RetryMiddleware):
                     backoff_time = min(10 *
                                        (2 ** retry_times), 300)  # Max 5 minutes
                     jitter = random.uniform(0, 5)  # Add random jitter
-                    wait_time = backoff_time + jitter
+                    # Never retry sooner than the server asked us to
+                    wait_time = max(backoff_time, retry_after) + jitter
 
                     spider.logger.warning(
                         f"Rate limited (429) on {
@@ -42,14 +70,17 @@ class CustomRetryMiddleware(RetryMiddleware):
                             wait_time:.1f} seconds before retry {retry_times}/{
                             self.max_retry_times}")
 
-                    time.sleep(wait_time)
-
-                    retryreq = request.copy()
+                    retryreq = request.replace(
+                        dont_filter=True,
+                        priority=request.priority + self.priority_adjust)
                     retryreq.meta['retry_times'] = retry_times
-                    retryreq.dont_filter = True
-                    retryreq.priority = request.priority + self.priority_adjust
 
-                    return retryreq
+                    # Wait on the reactor instead of blocking it, so other
+                    # in-flight requests keep being processed meanwhile.
+                    # Imported here so the configured reactor is installed
+                    # before this module touches it.
+                    from twisted.internet import reactor
+                    return deferLater(reactor, wait_time, lambda: retryreq)
                 else:
                     spider.logger.error(
                         f"Gave up retrying {
@@ -58,43 +89,105 @@ class CustomRetryMiddleware(RetryMiddleware):
             # Use default retry logic for other codes
             return self._retry(request, reason, spider) or response
 
+        # The slot answers normally again after its pause ran out: the next
+        # pause starts from scratch
+        if self.slot_paused_until:
+            slot_key = spider.crawler.engine.downloader.get_slot_key(request)
+            if self.slot_paused_until.get(slot_key, 0) <= time.time():
+                self.slot_paused_until.pop(slot_key, None)
+                self.slot_pause.pop(slot_key, None)
+
         return response
 
+    def _throttle_slot(self, request, response, spider):
+        """Pause the download slot, doubling the pause (capped) each time"""
+        retry_after = _parse_retry_after(
+            response.headers.get('Retry-After'), self.max_slot_delay)
+
+        slot_key = spider.crawler.engine.downloader.get_slot_key(request)
+        pause = min(
+            max(self.slot_pause.get(slot_key, 0) * 2, retry_after, 1),
+            self.max_slot_delay)
+        self.slot_pause[slot_key] = pause
+        self.slot_paused_until[slot_key] = max(
+            self.slot_paused_until.get(slot_key, 0), time.time() + pause)
+        spider.logger.info(
+            f"Pausing requests to {slot_key} for {pause:.1f}s "
+            f"after {response.status}")
+
+        return retry_after
+
+
+def _parse_retry_after(value, ceiling):
+    """
+    Return the Retry-After header as seconds clamped to [0, ceiling],
+    or 0 if absent/unparsable
+    """
+    if not value:
+        return 0
+    try:
+        seconds = float(value)
+    except ValueError:
+        # HTTP-date form is rare on rate limits; fall back to our backoff
+        return 0
+    # float() also accepts 'inf' and 'nan', which deferLater cannot wait on
+    if not math.isfinite(seconds):
+        return 0
+    return min(max(seconds, 0), ceiling)
+
 
 class RandomUserAgentMiddleware:
     """Rotate user agents to avoid detection"""
 
-    USER_AGENTS = [
+    USER_AGENTS = (
         'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
         'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
         'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0',
         'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15',
         'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-    ]
+    )
+    _UA_COUNT = len(USER_AGENTS)
 
     def process_request(self, request, spider):
         """Randomly select a user agent for each request"""
-        user_agent = random.choice(self.USER_AGENTS)
-        request.headers['User-Agent'] = user_agent
+        user_agent = self.USER_AGENTS[random.randrange(self._UA_COUNT)]
+        request.headers[b'User-Agent'] = user_agent
 
 
 class RateLimitHandlerMiddleware:
     """Add delays and handle rate limiting more gracefully"""
 
-    def __init__(self):
+    def __init__(self, min_delay=5):
+        self.min_delay = min_delay
         self.last_request_time = {}
 
+    @classmethod
+    def from_crawler(cls, crawler):
+        return cls(crawler.settings.getfloat('RATELIMIT_MIN_DELAY', 5))
+
     def process_request(self, request, spider):
         """Add extra delay between requests to the same domain"""
-        domain = request.url.split('/')[2]
+        # Parsed URL is cached per request and shared with other middlewares
+        domain = urlparse_cached(request).netloc
+        now = time.time()
+        delay = 0
 
         # Ensure minimum time between requests to same domain
         if domain in self.last_request_time:
-            elapsed = time.time() - self.last_request_time[domain]
-            min_delay = 5  # Minimum 5 seconds between requests
+            elapsed = now - self.last_request_time[domain]
+            min_delay = self.min_delay
 
             if elapsed < min_delay:
-                time.sleep(min_delay - elapsed + random.uniform(0, 2))
-
-        self.last_request_time[domain] = time.time()
+                delay = min_delay - elapsed + \
+                    random.uniform(0, min_delay * 0.4)
+
+        # Record when this request will actually go out, so concurrent
+        # requests to the same domain queue up behind it
+        self.last_request_time[domain] = now + delay
+
+        if delay:
+            # Delay on the reactor rather than sleeping, which would block
+            # every other request in flight
+            from twisted.internet import reactor
+            return deferLater(reactor, delay, lambda: None)
         return None
@@ -1,63 +1,66 @@
 import re
 
+from itemadapter import ItemAdapter
+
+_WS_RE = re.compile(r'\s+')
+_PRICE_RE = re.compile(r'[\d,]+(?:\.\d{2})?')
+# Boilerplate phrases stripped from descriptions, up to the end of sentence.
+# Phrases match across any whitespace since the text is not normalized first.
+_DESC_BOILERPLATE_RE = re.compile(
+    r'(?:Made\s+in\s+India|Disclaimer|Manufactured\s+and\s+Marketed\s+By:'
+    r'|Product\s+color\s+may\s+slightly\s+vary).*?(?=\.|$)',
+    re.IGNORECASE | re.DOTALL)
+
+# Fields cleaned with _clean_text, as single values or as lists of values
+_TEXT_FIELDS = ('product_name', 'sku', 'size', 'color', 'care_instructions')
+_LIST_FIELDS = ('size_list', 'color_list')
+
 
 class CleanProductPipeline:
     """Pipeline to clean and validate scraped product data"""
 
     def process_item(self, item, spider):
         """Clean each field of the item"""
+        adapter = ItemAdapter(item)
+        clean = self._clean_text
 
-        # Clean product name
-        if item.get('product_name'):
-            item['product_name'] = self._clean_text(item['product_name'])
+        # Clean plain text fields: name, SKU, size, color, care instructions
+        for field in _TEXT_FIELDS:
+            value = adapter.get(field)
+            if value:
+                adapter[field] = clean(value)
 
         # Ensure price is float or None
-        if item.get('price'):
-            if isinstance(item['price'], str):
-                item['price'] = self._extract_numeric_price(item['price'])
-
-        # Clean SKU
-        if item.get('sku'):
-            item['sku'] = self._clean_text(item['sku'])
-
-        # Clean size and color
-        if item.get('size'):
-            item['size'] = self._clean_text(item['size'])
-
-        if item.get('color'):
-            item['color'] = self._clean_text(item['color'])
+        price = adapter.get('price')
+        if price and isinstance(price, str):
+            adapter['price'] = self._extract_numeric_price(price)
 
         # Clean lists
-        if item.get('size_list'):
-            item['size_list'] = [self._clean_text(
-                s) for s in item['size_list'] if s]
-
-        if item.get('color_list'):
-            item['color_list'] = [self._clean_text(
-                c) for c in item['color_list'] if c]
+        for field in _LIST_FIELDS:
+            values = adapter.get(field)
+            if values:
+                adapter[field] = [clean(v) for v in values if v]
 
         # Clean description
-        if item.get('description'):
-            item['description'] = self._clean_description(item['description'])
-
-        # Clean care instructions
-        if item.get('care_instructions'):
-            item['care_instructions'] = self._clean_text(
-                item['care_instructions'])
+        description = adapter.get('description')
+        if description:
+            adapter['description'] = self._clean_description(description)
 
         # Validate and clean image URLs
-        if item.get('image_urls'):
-            item['image_urls'] = self._validate_image_urls(item['image_urls'])
+        image_urls = adapter.get('image_urls')
+        if image_urls:
+            adapter['image_urls'] = self._validate_image_urls(image_urls)
 
         # Clean product details dictionary
-        if item.get('product_details'):
+        product_details = adapter.get('product_details')
+        if product_details:
             cleaned_details = {}
-            for key, value in item['product_details'].items():
-                clean_key = self._clean_text(key)
-                clean_value = self._clean_text(value)
+            for key, value in product_details.items():
+                clean_key = clean(key)
+                clean_value = clean(value)
                 if clean_key and clean_value:
                     cleaned_details[clean_key] = clean_value
-            item['product_details'] = cleaned_details
+            adapter['product_details'] = cleaned_details
 
         return item
 
@@ -66,11 +69,8 @@ class CleanProductPipeline:
         if not text:
             return text
 
-        # Replace multiple spaces/newlines with single space
-        text = re.sub(r'\s+', ' ', text)
-        # Remove leading/trailing whitespace
-        text = text.strip()
-        return text
+        # Collapse whitespace runs and trim the ends; str.split() does both
+        return ' '.join(text.split())
 
     def _extract_numeric_price(self, price_text):
         """Extract numeric price from text"""
@@ -78,11 +78,7 @@ class CleanProductPipeline:
             return None
 
         # Remove currency symbols and commas
-        price_match = re.search(
-            r'[\d,]+(?:\.\d{2})?',
-            str(price_text).replace(
-                ',',
-                ''))
+        price_match = _PRICE_RE.search(str(price_text).replace(',', ''))
         if price_match:
             return float(price_match.group())
         return None
@@ -92,34 +88,16 @@ class CleanProductPipeline:
         if not description:
             return description
 
-        # Remove excessive whitespace
-        description = re.sub(r'\s+', ' ', description)
-
-        # Remove common boilerplate text patterns
-        patterns_to_remove = [
-            r'Made in India.*?(?=\.|$)',
-            r'Disclaimer.*?(?=\.|$)',
-            r'Manufactured and Marketed By:.*?(?=\.|$)',
-            r'Product color may slightly vary.*?(?=\.|$)',
-        ]
-
-        for pattern in patterns_to_remove:
-            description = re.sub(
-                pattern,
-                '',
-                description,
-                flags=re.IGNORECASE | re.DOTALL)
-
-        # Clean up extra spaces
-        description = re.sub(r'\s+', ' ', description).strip()
-
-        return description
+        # Remove common boilerplate text patterns, then normalize whitespace
+        description = _DESC_BOILERPLATE_RE.sub('', description)
+        return _WS_RE.sub(' ', description).strip()
 
     def _validate_image_urls(self, urls):
         """Validate and clean image URLs"""
         if not urls:
             return []
 
+        seen = set()
         clean_urls = []
         for url in urls:
             if url and isinstance(url, str):
@@ -128,8 +106,9 @@ class CleanProductPipeline:
 
                 # Ensure it's a valid URL
                 if url.startswith('http') and 'no-image' not in url.lower():
-                    # Avoid duplicates
-                    if url not in clean_urls:
+                    # Avoid duplicates while keeping the original order
+                    if url not in seen:
+                        seen.add(url)
                         clean_urls.append(url)
 
         return clean_urls
@@ -1,5 +1,7 @@
 # Scrapy settings for styleunion project
 
+from urllib.request import getproxies
+
 BOT_NAME = "styleunion"
 
 SPIDER_MODULES = ["styleunion.spiders"]
@@ -13,14 +15,31 @@ USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTM
 ROBOTSTXT_OBEY = False
 
 # Configure maximum concurrent requests performed by Scrapy (default: 16)
-CONCURRENT_REQUESTS = 1
+CONCURRENT_REQUESTS = 16
 
-# Configure a delay for requests for the same website (default: 0)
-DOWNLOAD_DELAY = 3
+# Configure a delay for requests for the same website (default: 0).
+# Kept small: AutoThrottle and the 429 handling in CustomRetryMiddleware
+# back off dynamically when the site pushes back.
+DOWNLOAD_DELAY = 0.5
+RANDOMIZE_DOWNLOAD_DELAY = True  # Randomize delay to seem more human
 
 # The download delay setting will honor only one of:
-CONCURRENT_REQUESTS_PER_DOMAIN = 1
-CONCURRENT_REQUESTS_PER_IP = 1
+CONCURRENT_REQUESTS_PER_DOMAIN = 8
+#CONCURRENT_REQUESTS_PER_IP = 16
+
+# Use HTTP/2 so concurrent requests to styleunion.in are multiplexed over a
+# single TLS connection. Only when h2 (Twisted[http2]) is installed and no
+# https proxy is configured, as Scrapy's HTTP/2 handler cannot use proxies;
+# otherwise the default HTTP/1.1 handler is kept.
+try:
+    import h2  # noqa: F401
+except ImportError:
+    h2 = None
+
+if h2 is not None and "https" not in getproxies():
+    DOWNLOAD_HANDLERS = {
+        "https": "scrapy.core.downloader.handlers.http2.H2DownloadHandler",
+    }
 
 # Disable cookies (enabled by default)
 COOKIES_ENABLED = True
@@ -70,21 +89,26 @@ ITEM_PIPELINES = {
 AUTOTHROTTLE_ENABLED = True
 AUTOTHROTTLE_START_DELAY = 3
 AUTOTHROTTLE_MAX_DELAY = 10
-AUTOTHROTTLE_TARGET_CONCURRENCY = 1.0
+AUTOTHROTTLE_TARGET_CONCURRENCY = 4.0
 AUTOTHROTTLE_DEBUG = False
 
 # Enable and configure HTTP caching (disabled by default)
 HTTPCACHE_ENABLED = False
 HTTPCACHE_EXPIRATION_SECS = 0
 HTTPCACHE_DIR = "httpcache"
-HTTPCACHE_IGNORE_HTTP_CODES = [429, 503]
-HTTPCACHE_STORAGE = "scrapy.extensions.httpcache.FilesystemCacheStorage"
+# Do not cache any status that is retried (see RETRY_HTTP_CODES below):
+# the cache answers before the retry middleware sees the response
+HTTPCACHE_IGNORE_HTTP_CODES = [429, 500, 502, 503, 504, 522, 524, 408, 400]
+# Keep the cache in a single DBM file instead of one directory per response
+HTTPCACHE_STORAGE = "scrapy.extensions.httpcache.DbmCacheStorage"
 
 # Retry settings
 RETRY_ENABLED = True
 RETRY_TIMES = 5
 RETRY_HTTP_CODES = [429, 500, 502, 503, 504, 522, 524, 408, 400]
 RETRY_PRIORITY_ADJUST = -1
+# Upper bound for the per-domain pause applied on 429/503 responses
+RETRY_MAX_SLOT_DELAY = 60
 
 # Download timeout
 DOWNLOAD_TIMEOUT = 30
@@ -110,11 +134,10 @@ FEED_EXPORT_FIELDS = [
 # Set log level
 LOG_LEVEL = "INFO"
 
-# Respect crawl rate
-DOWNLOAD_DELAY = 5  # 5 seconds between requests
-RANDOMIZE_DOWNLOAD_DELAY = True  # Randomize delay to seem more human
+# Minimum spacing between requests to the same domain enforced by
+# RateLimitHandlerMiddleware, in seconds
+RATELIMIT_MIN_DELAY = 0.5
 
 # Set settings whose default value is deprecated to a future-proof value
 REQUEST_FINGERPRINTER_IMPLEMENTATION = "2.7"
 TWISTED_REACTOR = "twisted.internet.asyncioreactor.AsyncioSelectorReactor"
-FEED_EXPORT_INDENT = 2
@@ -1,35 +1,146 @@
 import scrapy
 import json
+import math
 import re
-from urllib.parse import urljoin
+from html import unescape
+from urllib.parse import parse_qs, urlencode, urlsplit, urlunsplit
 from styleunion.items import ProductItem
 from scrapy.exceptions import CloseSpider
 
+# orjson parses Shopify product JSON several times faster than the stdlib;
+# its JSONDecodeError subclasses json.JSONDecodeError, so handling is shared
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+# selectolax converts body_html to text with a C HTML parser, which also
+# decodes every entity; the regex conversion below is used without it
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# Variant option values treated as sizes, besides plain numbers
+_ALPHA_SIZES = frozenset(('XXS', 'XS', 'S', 'M', 'L', 'XL', 'XXL', 'XXXL'))
+_WS_RE = re.compile(r'\s+')
+
+# Sort order for alpha sizes; anything else (numeric sizes) sorts last
+_SIZE_ORDER = {
+    'XXS': 1,
+    'XS': 2,
+    'S': 3,
+    'M': 4,
+    'L': 5,
+    'XL': 6,
+    'XXL': 7,
+    'XXXL': 8}
+
+# Product details / description sections of the cleaned body text
+_DETAILS_RE = re.compile(
+    r'Product Details[:\s]*(.*?)(?:Description[:\s]+(.*))?$',
+    re.IGNORECASE | re.DOTALL)
+_DESCRIPTION_RE = re.compile(
+    r'Description[:\s]+(.*)', re.IGNORECASE | re.DOTALL)
+_DETAILS_SPLIT_RE = re.compile(r'\n+|(?<=\w)\s{2,}(?=[A-Z])')
+_KEY_VALUE_RE = re.compile(r'^([A-Za-z\s]+?)\s+([\w%\s,/\-]+)$')
+_DESC_CARE_RE = re.compile(
+    r'Wash and Care[:\s]*.*?(?:Fade|Clean)\.?', re.IGNORECASE | re.DOTALL)
+# Fallback detail lookups when there is no "Product Details" section
+_DETAIL_KEYWORD_RES = [
+    (keyword, re.compile(rf'{keyword}[:\s]+([^\n\.]+)', re.IGNORECASE))
+    for keyword in (
+        'Fabric Type',
+        'Weave Type',
+        'Pattern',
+        'Length',
+        'Fit',
+        'Waist Rise',
+        'Pockets',
+        'Cut Shape',
+        'Neckline',
+        'Sleeve',
+    )
+]
+
+# HTML to text conversion
+_SCRIPT_RE = re.compile(
+    r'<script[^>]*>.*?</script>', re.DOTALL | re.IGNORECASE)
+_STYLE_RE = re.compile(r'<style[^>]*>.*?</style>', re.DOTALL | re.IGNORECASE)
+_BR_RE = re.compile(r'<br\s*/?>')
+_TAG_RE = re.compile(r'<[^>]+>')
+_SPACES_RE = re.compile(r' +')
+
+# Care instructions
+_CARE_RES = [
+    re.compile(p, re.IGNORECASE | re.DOTALL) for p in (
+        r'(?:Wash and Care|Care Instructions?|Washing Instructions?)[:\s]+((?:(?:Hand|Machine)?\s*Wash|Do Not|Dry|Iron|Bleach|Clean|Hang|Fade|Tumble)[^\n]*(?:\n(?:(?:Hand|Machine)?\s*Wash|Do Not|Dry|Iron|Bleach|Clean|Hang|Fade|Tumble)[^\n]*)*)',
+        # Sentence run is bounded so a "Hand Wash" with no closing
+        # Fade/Clean sentence cannot scan the rest of the text repeatedly
+        r'((?:Hand Wash|Machine Wash)[^\.]+\.(?:[^\.]+\.){0,10}?(?:Fade|Clean)[^\.]*\.)',
+    )
+]
+_CARE_DOT_RE = re.compile(r'\s*\.\s*')
+_CARE_WORD_RE = re.compile(
+    r'(wash|dry|iron|bleach|clean|fade|hang|tumble)', re.IGNORECASE)
+
+
+def _size_key(size, _order=_SIZE_ORDER):
+    return _order.get(size.upper(), 999)
+
+
+def _fix_image_url(src):
+    """Make a Shopify image src absolute and request the 1200px rendition"""
+    if src.startswith('//'):
+        src = 'https:' + src
+    return f"{src}{'&' if '?' in src else '?'}width=1200"
+
 
 class StyleUnionSpiderJSON(scrapy.Spider):
    
     name = "styleunion_spider_json"
     allowed_domains = ["styleunion.in"]
 
-    start_urls = [
-        "https://styleunion.in/collections/new-in-women?page=1"
-    ]
+    # Shopify's products.json returns up to 250 full products per page,
+    # replacing one listing request plus one request per product
+    products_json_url = (
+        "https://styleunion.in/collections/new-in-women/products.json")
+    page_size = 250
 
     custom_settings = {
-        "CONCURRENT_REQUESTS": 2,
-        "DOWNLOAD_DELAY": 3,
-        "RANDOMIZE_DOWNLOAD_DELAY": True,
+        # JSON responses are small and independent, so fetch them in
+        # parallel and let AutoThrottle adapt to the server's latency.
+        # RateLimitHandlerMiddleware still spaces requests to the domain
+        # by RATELIMIT_MIN_DELAY (0.5s plus jitter) on top of this.
+        "CONCURRENT_REQUESTS": 16,
+        "CONCURRENT_REQUESTS_PER_DOMAIN": 8,
+        "DOWNLOAD_DELAY": 0,
         "AUTOTHROTTLE_ENABLED": True,
         "AUTOTHROTTLE_START_DELAY": 3,
         "AUTOTHROTTLE_MAX_DELAY": 10,
-        "AUTOTHROTTLE_TARGET_CONCURRENCY": 2.0,
+        "AUTOTHROTTLE_TARGET_CONCURRENCY": 4.0,
+        "HTTPCACHE_ENABLED": True,
+        # Never cache a status that CustomRetryMiddleware retries: the cache
+        # sits closer to the downloader, so a stored error would answer the
+        # retry too. Kept in line with RETRY_HTTP_CODES in settings.py.
+        "HTTPCACHE_IGNORE_HTTP_CODES": [
+            429, 500, 502, 503, 504, 522, 524, 408, 400],
+        # Serve reruns from the cache (default DummyPolicy), but refetch
+        # listing pages cached more than a day ago. Only successful pages
+        # are kept that long; error statuses are ignored above.
+        "HTTPCACHE_EXPIRATION_SECS": 86400,
+        "HTTPCOMPRESSION_ENABLED": True,
         "DEPTH_LIMIT": 100,
+        # Resolve styleunion.in once and reuse it; keep DNS lookups from
+        # queueing behind other work in the reactor thread pool
+        "DNSCACHE_ENABLED": True,
+        "DNS_TIMEOUT": 5,
+        "REACTOR_THREADPOOL_MAXSIZE": 20,
         # Export settings
         "FEEDS": {
-            "output.json": {
-                "format": "json",
+            "output.jsonl": {
+                "format": "jsonlines",
                 "encoding": "utf8",
-                "indent": 2,
                 "overwrite": True,
             },
             "output.csv": {
@@ -44,9 +155,29 @@ class StyleUnionSpiderJSON(scrapy.Spider):
         super().__init__(*args, **kwargs)
         self.product_count = 0
         self.max_products = 1000
+        # Product handles already emitted, across all listing pages
+        self._seen_products = set()
+        # Listing pages requested up front, enough to cover max_products
+        self.eager_pages = math.ceil(self.max_products / self.page_size)
+
+    async def start(self):
+        """Request the first listing pages up front, in parallel"""
+        for request in self._eager_page_requests():
+            yield request
+
+    def start_requests(self):
+        """Entry point for Scrapy versions before 2.13, which lack start()"""
+        yield from self._eager_page_requests()
+
+    def _eager_page_requests(self):
+        """Build the requests for listing pages 1..eager_pages"""
+        for page in range(1, self.eager_pages + 1):
+            yield scrapy.Request(
+                f"{self.products_json_url}?limit={self.page_size}&page={page}",
+                callback=self.parse)
 
     def parse(self, response):
-        
+        """Parse one page of the collection's products.json listing"""
 
         if self.product_count >= self.max_products:
             self.logger.info(
@@ -54,182 +185,139 @@ class StyleUnionSpiderJSON(scrapy.Spider):
                     self.max_products}")
             raise CloseSpider(f'Reached maximum products: {self.max_products}')
 
-        product_links = response.css(
-            "a[href*='/products/']::attr(href)").getall()
-
-        seen = set()
-        for link in product_links:
-            if self.product_count >= self.max_products:
-                break
-
-            if '/products/' in link:
-                base_link = link.split('?')[0]
-                if base_link not in seen:
-                    seen.add(base_link)
-                    full_url = urljoin(response.url, base_link)
-
-                    # Request the .json version of the product page
-                    json_url = full_url + '.json'
-                    self.logger.info(f"Requesting JSON: {json_url}")
-                    yield scrapy.Request(json_url, callback=self.parse_product_json)
-
-        # Pagination
-        if self.product_count < self.max_products and product_links:
-            current_page = self._extract_page_number(response.url)
-            if current_page < 100:  # Safety limit
-                next_page_url = self._build_next_page_url(
-                    response.url, current_page)
-                self.logger.info(f"Moving to page {current_page + 1}")
-                yield scrapy.Request(next_page_url, callback=self.parse)
-
-    def parse_product_json(self, response):
-        """Parse product from Shopify JSON API"""
-
-        if self.product_count >= self.max_products:
+        try:
+            # Raw bytes: orjson parses UTF-8 directly, skipping the str decode
+            data = json_loads(response.body)
+        except json.JSONDecodeError as e:
+            self.logger.error(f"JSON decode error for {response.url}: {e}")
             return
 
-        try:
-            data = json.loads(response.text)
-            product = data.get('product', {})
+        products = data.get('products', [])
+        if not products:
+            self.logger.info(f"No more products at {response.url}")
+            return
 
-            if not product:
-                self.logger.warning(f"No product data in JSON: {response.url}")
-                return
+        # .../collections/<name>/products.json?... -> .../collections/<name>/products
+        products_url = response.url.split('.json', 1)[0]
 
+        for product in products:
             if self.product_count >= self.max_products:
                 self.logger.info("Reached 1000 items. Stopping spider.")
-                raise CloseSpider("Reached 1000 items")
+                break
 
-            self.product_count += 1
+            # Pages can overlap when the collection changes mid-crawl
+            handle = product.get('handle')
+            if handle in self._seen_products:
+                continue
+            self._seen_products.add(handle)
 
-            item = ProductItem()
-
-            # Basic info
-            item['product_url'] = response.url.replace('.json', '')
-            item['product_name'] = product.get('title')
-            item['currency'] = '₹'
-
-            # Extract product details and description
-            body_html = product.get('body_html', '')
-            product_details_dict, description_str = self._extract_details_and_description(
-                body_html)
-            item['product_details'] = product_details_dict
-            item['description'] = description_str
-
-            # Get first variant for default values
-            variants = product.get('variants', [])
-            if variants:
-                first_variant = variants[0]
-                item['price'] = float(first_variant.get('price', 0))
-                item['sku'] = first_variant.get('sku')
-            else:
-                item['price'] = None
-                item['sku'] = None
+            product_url = f"{products_url}/{handle}"
+            try:
+                item = self._build_item(product, product_url)
+            except Exception:
+                # Logs the message together with the current traceback
+                self.logger.exception(f"Error parsing {product_url}")
+                continue
 
-            # Extract sizes and colors from all variants
-            sizes = set()
-            colors = set()
+            self.product_count += 1
+            yield item
 
-            for variant in variants:
-                option1 = variant.get('option1')
-                option2 = variant.get('option2')
-                option3 = variant.get('option3')
+        # Pagination: only continue past the pages requested up front
+        if self.product_count < self.max_products:
+            current_page, next_page_url = self._bump_page(response.url)
+            if self.eager_pages <= current_page < 100:  # Safety limit
+                self.logger.info(f"Moving to page {current_page + 1}")
+                yield scrapy.Request(next_page_url, callback=self.parse)
 
-                # Try to determine which is size and which is color
-                if option1:
-                    option1_upper = str(option1).strip().upper()
-                    # If it looks like a size (XS, S, M, L, XL, etc.)
-                    if re.match(
-                        r'^(XXS|XS|S|M|L|XL|XXL|XXXL|\d+)$',
-                            option1_upper):
-                        sizes.add(str(option1).strip())
-                    else:
-                        colors.add(str(option1).strip())
-
-                if option2:
-                    option2_str = str(option2).strip()
-                    option2_upper = option2_str.upper()
-                    # Check if option2 is a size
-                    if re.match(
-                        r'^(XXS|XS|S|M|L|XL|XXL|XXXL|\d+)$',
-                            option2_upper):
-                        sizes.add(option2_str)
-                    else:
-                        colors.add(option2_str)
-
-                if option3:
-                    colors.add(str(option3).strip())
-
-            # Sort sizes properly (XS, S, M, L, XL, XXL)
-            size_order = {
-                'XXS': 1,
-                'XS': 2,
-                'S': 3,
-                'M': 4,
-                'L': 5,
-                'XL': 6,
-                'XXL': 7,
-                'XXXL': 8}
-            sorted_sizes = sorted(
-                list(sizes),
-                key=lambda x: size_order.get(x.upper(), 999)
-            )
-
-            item['size_list'] = sorted_sizes if sorted_sizes else []
-            item['color_list'] = sorted(list(colors)) if colors else []
-            item['size'] = item['size_list'][0] if item['size_list'] else None
-            item['color'] = item['color_list'][0] if item['color_list'] else None
-
-            # Images
-            images = []
-            for img in product.get('images', []):
-                img_url = img.get('src')
-                if img_url:
-                    # Add https: if needed
-                    if img_url.startswith('//'):
-                        img_url = 'https:' + img_url
-                    # Add width parameter
-                    if '?' in img_url:
-                        img_url = img_url + '&width=1200'
-                    else:
-                        img_url = img_url + '?width=1200'
-                    images.append(img_url)
+    def _build_item(self, product, product_url):
+        """Build a ProductItem from a Shopify product JSON object"""
 
-            item['image_urls'] = images
+        # Convert the description HTML to text once for all extractors
+        body_text = self._clean_html(product.get('body_html', ''))
 
-            # Care instructions
-            item['care_instructions'] = self._extract_care_instructions(
-                body_html)
+        # Extract product details and description
+        product_details_dict, description_str = self._extract_details_and_description(
+            body_text)
 
-            self.logger.info(
-                f"✓ Extracted: {item['product_name']} - ₹{item['price']}")
+        # Get first variant for default values
+        variants = product.get('variants', [])
+        if variants:
+            first_variant = variants[0]
+            price = float(first_variant.get('price', 0))
+            sku = first_variant.get('sku')
+        else:
+            price = None
+            sku = None
+
+        # Extract sizes and colors from all variants
+        sizes = set()
+        colors = set()
+        # The same option values repeat on every variant, so each distinct
+        # option1/option2 value is classified as size or color only once
+        classified = set()
+
+        for variant in variants:
+            # option1/option2 may hold a size or a color; option3 is a color
+            for index, option in enumerate((variant.get('option1'),
+                                            variant.get('option2'),
+                                            variant.get('option3'))):
+                if not option:
+                    continue
+                value = str(option).strip()
+                if index == 2:
+                    colors.add(value)
+                elif value not in classified:
+                    classified.add(value)
+                    # If it looks like a size (XS, S, M, L, XL, etc.)
+                    if value.upper() in _ALPHA_SIZES or value.isdecimal():
+                        sizes.add(value)
+                    else:
+                        colors.add(value)
+
+        # Sort sizes properly (XS, S, M, L, XL, XXL)
+        size_list = sorted(sizes, key=_size_key)
+        color_list = sorted(colors)
+
+        # Images
+        images = [_fix_image_url(img['src'])
+                  for img in product.get('images', ()) if img.get('src')]
+
+        # Build the item in one go once every field is known
+        item = ProductItem(
+            product_url=product_url,
+            product_name=product.get('title'),
+            price=price,
+            sku=sku,
+            size=size_list[0] if size_list else None,
+            color=color_list[0] if color_list else None,
+            size_list=size_list,
+            color_list=color_list,
+            description=description_str,
+            care_instructions=self._extract_care_instructions(body_text),
+            image_urls=images,
+            product_details=product_details_dict,
+            currency='₹',
+        )
 
-            yield item
+        self.logger.info(
+            f"✓ Extracted: {item.product_name} - ₹{item.price}")
 
-        except json.JSONDecodeError as e:
-            self.logger.error(f"JSON decode error for {response.url}: {e}")
-        except Exception as e:
-            self.logger.error(f"Error parsing {response.url}: {e}")
-            import traceback
-            self.logger.error(traceback.format_exc())
+        return item
 
-    def _extract_details_and_description(self, body_html):
+    def _extract_details_and_description(self, text):
         """
-        Extract product details as dict and description from body HTML.
+        Extract product details as dict and description from the cleaned
+        body text (see _clean_html).
         Returns: (product_details_dict, description_string)
         """
-        if not body_html:
+        if not text:
             return {}, ""
 
-        text = self._clean_html(body_html)
-
         # Pattern to find "Product Details" section and extract until
-        # "Description"
-        details_match = re.search(
-            r'Product Details[:\s]*(.*?)(?:Description[:\s]+(.*))?$',
-            text,
-            re.IGNORECASE | re.DOTALL
-        )
+        # "Description"; a plain substring test rules it out cheaply first
+        details_match = None
+        if 'product details' in text.lower():
+            details_match = _DETAILS_RE.search(text)
 
         product_details_dict = {}
         description = ""
@@ -243,9 +331,7 @@ class StyleUnionSpiderJSON(scrapy.Spider):
             # Split by common separators and newlines
             # First, try to split by multiple spaces or newlines followed by
             # capital letters
-            segments = re.split(
-                r'\n+|(?<=\w)\s{2,}(?=[A-Z])',
-                product_details_text)
+            segments = _DETAILS_SPLIT_RE.split(product_details_text)
 
             for segment in segments:
                 segment = segment.strip()
@@ -262,8 +348,7 @@ class StyleUnionSpiderJSON(scrapy.Spider):
                 else:
                     # Try to match pattern "Key Value" where Key contains
                     # letters/spaces
-                    match = re.match(
-                        r'^([A-Za-z\s]+?)\s+([\w%\s,/\-]+)$', segment)
+                    match = _KEY_VALUE_RE.match(segment)
                     if match:
                         key = match.group(1).strip()
                         value = match.group(2).strip()
@@ -274,53 +359,29 @@ class StyleUnionSpiderJSON(scrapy.Spider):
             # Clean description - remove care instructions
             if description:
                 # Remove "Wash and Care" section
-                description = re.sub(
-                    r'Wash and Care[:\s]*.*?(?:Fade|Clean)\.?',
-                    '',
-                    description,
-                    flags=re.IGNORECASE | re.DOTALL
-                )
+                description = _DESC_CARE_RE.sub('', description)
                 # Clean up extra whitespace
-                description = re.sub(r'\s+', ' ', description).strip()
+                description = _WS_RE.sub(' ', description).strip()
         else:
             # Fallback: Look for common product detail keywords anywhere in
             # text
-            detail_keywords = [
-                'Fabric Type',
-                'Weave Type',
-                'Pattern',
-                'Length',
-                'Fit',
-                'Waist Rise',
-                'Pockets',
-                'Cut Shape',
-                'Neckline',
-                'Sleeve']
-
-            for keyword in detail_keywords:
-                pattern = rf'{keyword}[:\s]+([^\n\.]+)'
-                match = re.search(pattern, text, re.IGNORECASE)
+            for keyword, pattern in _DETAIL_KEYWORD_RES:
+                match = pattern.search(text)
                 if match:
                     value = match.group(1).strip()
                     # Clean up value
-                    value = re.sub(r'\s+', ' ', value)
+                    value = _WS_RE.sub(' ', value)
                     product_details_dict[keyword] = value
 
             # If we found details, try to extract description as the rest
             if product_details_dict:
                 # Try to find "Description" section
-                desc_match = re.search(
-                    r'Description[:\s]+(.*)', text, re.IGNORECASE | re.DOTALL)
+                desc_match = _DESCRIPTION_RE.search(text)
                 if desc_match:
                     description = desc_match.group(1).strip()
                     # Remove care instructions
-                    description = re.sub(
-                        r'Wash and Care[:\s]*.*?(?:Fade|Clean)\.?',
-                        '',
-                        description,
-                        flags=re.IGNORECASE | re.DOTALL
-                    )
-                    description = re.sub(r'\s+', ' ', description).strip()
+                    description = _DESC_CARE_RE.sub('', description)
+                    description = _WS_RE.sub(' ', description).strip()
             else:
                 # No details found, whole text might be description
                 description = text
@@ -331,89 +392,87 @@ class StyleUnionSpiderJSON(scrapy.Spider):
         """Remove HTML tags and clean text"""
         if not html_text:
             return ""
-        # Remove script and style tags with their content
-        html_text = re.sub(
-            r'<script[^>]*>.*?</script>',
-            '',
-            html_text,
-            flags=re.DOTALL | re.IGNORECASE)
-        html_text = re.sub(
-            r'<style[^>]*>.*?</style>',
-            '',
-            html_text,
-            flags=re.DOTALL | re.IGNORECASE)
-        # Replace common HTML elements with appropriate text markers
-        text = re.sub(r'<br\s*/?>', '\n', html_text)
-        text = re.sub(r'</p>', '\n\n', text)
-        text = re.sub(r'<li>', '\n- ', text)
-        text = re.sub(r'</li>', '\n', text)
-        # Remove all remaining HTML tags
-        text = re.sub(r'<[^>]+>', ' ', text)
-        # Decode HTML entities
-        text = text.replace('&nbsp;', ' ')
-        text = text.replace('&amp;', '&')
-        text = text.replace('&lt;', '<')
-        text = text.replace('&gt;', '>')
-        text = text.replace('&quot;', '"')
+        if LexborHTMLParser is not None:
+            text = self._html_to_text(html_text)
+        else:
+            text = self._html_to_text_regex(html_text)
         # Normalize whitespace but keep paragraph breaks
         lines = [line.strip() for line in text.split('\n')]
         text = '\n'.join(line for line in lines if line)
         # Clean up extra spaces within lines
-        text = re.sub(r' +', ' ', text)
+        text = _SPACES_RE.sub(' ', text)
         return text.strip()
 
-    def _extract_care_instructions(self, body_html):
-        """Extract care instructions from product description"""
-        if not body_html:
+    def _html_to_text(self, html_text):
+        """Convert HTML to text with selectolax, keeping line breaks"""
+        tree = LexborHTMLParser(html_text)
+        # Remove script and style tags with their content
+        tree.strip_tags(['script', 'style'])
+        # Insert the same text markers as the regex conversion
+        for node in tree.css('br'):
+            node.replace_with('\n')
+        for node in tree.css('li'):
+            node.insert_before('\n- ')
+            node.insert_after('\n')
+        for node in tree.css('p'):
+            node.insert_after('\n\n')
+        # Separate text nodes with a space, as tag removal does
+        return tree.body.text(separator=' ').replace('\xa0', ' ')
+
+    def _html_to_text_regex(self, html_text):
+        """Convert HTML to text with regex substitutions"""
+        # Remove script and style tags with their content
+        html_text = _SCRIPT_RE.sub('', html_text)
+        html_text = _STYLE_RE.sub('', html_text)
+        # Replace common HTML elements with appropriate text markers
+        text = _BR_RE.sub('\n', html_text)
+        text = text.replace('</p>', '\n\n')
+        text = text.replace('<li>', '\n- ')
+        text = text.replace('</li>', '\n')
+        # Remove all remaining HTML tags
+        text = _TAG_RE.sub(' ', text)
+        # Decode all named and numeric HTML entities in one pass
+        return unescape(text).replace('\xa0', ' ')
+
+    def _extract_care_instructions(self, text):
+        """Extract care instructions from the cleaned body text"""
+        if not text:
             return None
 
-        text = self._clean_html(body_html)
+        # Every care pattern needs "wash" or a "Care Instructions" header;
+        # most descriptions have neither, so skip the regexes for those
+        lowered = text.lower()
+        if 'wash' not in lowered and 'care instruction' not in lowered:
+            return None
 
         # Look for "Wash and Care" section with various patterns
-        care_patterns = [
-            r'(?:Wash and Care|Care Instructions?|Washing Instructions?)[:\s]+((?:(?:Hand|Machine)?\s*Wash|Do Not|Dry|Iron|Bleach|Clean|Hang|Fade|Tumble)[^\n]*(?:\n(?:(?:Hand|Machine)?\s*Wash|Do Not|Dry|Iron|Bleach|Clean|Hang|Fade|Tumble)[^\n]*)*)',
-            r'((?:Hand Wash|Machine Wash)[^\.]+\.(?:[^\.]+\.)*?(?:Fade|Clean)[^\.]*\.)',
-        ]
-
-        for pattern in care_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+        for pattern in _CARE_RES:
+            match = pattern.search(text)
             if match:
                 care_text = match.group(1).strip()
                 # Clean up and format
-                care_text = re.sub(r'\s+', ' ', care_text)
-                care_text = re.sub(r'\s*\.\s*', '. ', care_text)
-                # Remove trailing incomplete sentences
-                sentences = care_text.split('.')
-                valid_sentences = []
-                for sentence in sentences:
-                    sentence = sentence.strip()
-                    if sentence and re.search(
-                        r'(wash|dry|iron|bleach|clean|fade|hang|tumble)',
-                        sentence,
-                            re.IGNORECASE):
-                        valid_sentences.append(sentence)
+                care_text = _WS_RE.sub(' ', care_text)
+                care_text = _CARE_DOT_RE.sub('. ', care_text)
+                # Keep only sentences that are actual care instructions;
+                # split('.') drops the periods, so every one is re-added
+                sentences = map(str.strip, care_text.split('.'))
+                valid_sentences = [
+                    sentence for sentence in sentences
+                    if sentence and _CARE_WORD_RE.search(sentence)]
 
                 if valid_sentences:
-                    return '. '.join(
-                        valid_sentences) + ('.' if not valid_sentences[-1].endswith('.') else '')
+                    return '. '.join(valid_sentences) + '.'
 
         return None
 
-    def _extract_page_number(self, url):
-        """Extract current page number from URL"""
-        if "page=" in url:
-            try:
-                return int(url.split("page=")[1].split("&")[0])
-            except (ValueError, IndexError):
-                return 1
-        return 1
-
-    def _build_next_page_url(self, url, current_page):
-        """Build next page URL"""
-        if "page=" in url:
-            return url.replace(
-                f"page={current_page}", f"page={
-                    current_page + 1}")
-        else:
-            separator = "&" if "?" in url else "?"
-            return f"{url}{separator}page={current_page + 1}"
+    def _bump_page(self, url):
+        """Return the page number of url and the URL of the page after it"""
+        parts = urlsplit(url)
+        query = parse_qs(parts.query)
+        try:
+            page = int(query.get('page', ['1'])[0])
+        except ValueError:
+            page = 1
+        query['page'] = [str(page + 1)]
+        next_query = urlencode(query, doseq=True)
+        return page, urlunsplit(parts._replace(query=next_query))